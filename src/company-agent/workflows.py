@@ -9,8 +9,10 @@ The extraction is fully programmatic - it parses main.py to find:
 - Direct edges: builder.add_edge() calls
 - Conditional edges: builder.add_conditional_edges() calls
 
-Then uses DFS to find all paths from START to END, and normalizes them using
-Kleene star notation to eliminate redundancy from self-loops.
+The source is parsed once with the ast module, then all paths from START to END are
+enumerated (topologically when the graph is a DAG apart from self-loops, with DFS
+otherwise), and they are normalized using Kleene star notation to eliminate
+redundancy from self-loops.
 
 Usage:
     from workflows import extract_and_normalize_workflows, print_workflows
@@ -20,10 +22,23 @@ Usage:
     print_workflows(workflows)
 """
 import os
-import re
+import ast
+import sys
+import json
+import mmap
 import asyncio
+import hashlib
 from collections import defaultdict
+from collections.abc import Collection, Sequence
+from contextlib import contextmanager
+from math import prod
 from pydantic import BaseModel, Field
+from uipath_langchain.chat.models import UiPathAzureChatOpenAI
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization when installed
+    orjson = None
 
 # DATA MODELS
 class WorkflowPath(BaseModel):
@@ -36,49 +51,182 @@ class WorkflowPath(BaseModel):
     evaluator_rationale: str = Field(default="", description="Why this evaluator is recommended")
 
 
+class WorkflowInput(BaseModel):
+    """Agent input fields (mirrors GraphState in main.py); unused fields stay null."""
+    question: str | None = Field(default=None, description="The user's question")
+    category: str | None = Field(default=None, description="Category hint (policy/procurement/hr)")
+    human_feedback: str | None = Field(default=None, description="Human feedback for supervisor")
+    email: str | None = Field(default=None, description="User email (required for procurement/hr)")
+    code: str | None = Field(default=None, description="4-digit code (required for procurement)")
+
+
+class WorkflowAnalysis(BaseModel):
+    """Structured LLM response describing how to trigger and evaluate a workflow."""
+    required_input: WorkflowInput = Field(description="Input fields needed for this workflow, each describing what value it needs")
+    example_input: WorkflowInput = Field(description="Complete input example that would trigger this workflow")
+    recommended_evaluator: str = Field(description="Name of the best evaluator for this workflow")
+    evaluator_rationale: str = Field(description="1-2 sentences explaining why this evaluator is recommended")
+
+
 # STEP 1: EXTRACT GRAPH STRUCTURE FROM CODE
+_BUILDER_NAME = "builder"
+_EDGE_METHODS = frozenset({"add_edge", "add_conditional_edges"})
+
+
+@contextmanager
+def _map_source(file_path: str):
+    """Memory-map a source file read-only instead of reading it into a string.
+
+    Args:
+        file_path: Path to the source file
+
+    Yields:
+        Read-only buffer with the file contents (empty bytes for an empty file)
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _call_arg(call: ast.Call, index: int, keyword: str) -> ast.expr | None:
+    """Get a call argument passed either positionally or by keyword.
+
+    Args:
+        call: AST call node
+        index: Position of the argument
+        keyword: Keyword name of the argument
+
+    Returns:
+        The argument expression, or None if it was not passed
+    """
+    if index < len(call.args):
+        return call.args[index]
+    for kw in call.keywords:
+        if kw.arg == keyword:
+            return kw.value
+    return None
+
+
+def _node_name(arg: ast.expr | None) -> str:
+    """Resolve a node reference to its name.
+
+    Args:
+        arg: AST expression passed as a node (string literal or START/END constant)
+
+    Returns:
+        Node name, or empty string if the expression is not a node reference
+    """
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        return sys.intern(arg.value)
+    if isinstance(arg, ast.Name):
+        return sys.intern(arg.id)
+    return ""
+
+
 def extract_graph_from_code(file_path: str) -> dict:
     """Extract graph structure by parsing Python code.
 
+    Parsing costs a few milliseconds on main.py, far more than a regex scan, in
+    exchange for handling keyword arguments. ast.walk is breadth-first, so nodes
+    and edges come out in walk order rather than source order.
+
     Args:
         file_path: Path to main.py
 
     Returns:
         Dictionary with adjacency list representation
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        code = f.read()
-
     graph = defaultdict(list)
 
-    # Extract direct edges: builder.add_edge(START, "supervisor")
-    edge_pattern = r'builder\.add_edge\((["\']?\w+["\']?)\s*,\s*(["\']?\w+["\']?)\)'
-    edges = re.findall(edge_pattern, code)
+    with _map_source(file_path) as code:
+        # Skip parsing entirely when no edge calls appear in the source
+        if not any(code.find(method.encode()) != -1 for method in _EDGE_METHODS):
+            return graph
+
+        tree = ast.parse(code)
+
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr in _EDGE_METHODS
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == _BUILDER_NAME):
+            continue
+
+        # Extract direct edges: builder.add_edge(START, "supervisor")
+        if node.func.attr == "add_edge":
+            src = _node_name(_call_arg(node, 0, "start_key"))
+            tgt = _node_name(_call_arg(node, 1, "end_key"))
+            if src and tgt:
+                graph[src].append(tgt)
+
+        # Extract conditional edges: builder.add_conditional_edges("source", func, {...})
+        elif node.func.attr == "add_conditional_edges":
+            source = _node_name(_call_arg(node, 0, "source"))
+            targets = _call_arg(node, 2, "path_map")
+            if source and isinstance(targets, ast.Dict):
+                for target in targets.values:
+                    target = _node_name(target)
+                    if target:
+                        graph[source].append(target)
+
+    return graph
+
+
+# STEP 2: FIND ALL PATHS USING DFS
+def _index_graph(graph: dict, start: str, end: str) -> tuple[list[str], dict[str, int], list[list[int]]]:
+    """Map node names to dense integer ids with successor lists indexed by id.
+
+    Args:
+        graph: Adjacency list representation
+        start: Starting node
+        end: Ending node
 
-    for src, tgt in edges:
-        src = src.strip('"\'')
-        tgt = tgt.strip('"\'')
-        graph[src].append(tgt)
+    Returns:
+        Tuple of (node names by id, id by node name, successor ids by id)
+    """
+    names = list(dict.fromkeys([start, end, *graph, *(node for nodes in graph.values() for node in nodes)]))
+    ids = {name: i for i, name in enumerate(names)}
+    successors = [[ids[node] for node in graph.get(name, [])] for name in names]
+    return names, ids, successors
 
-    # Extract conditional edges: builder.add_conditional_edges("source", func, {...})
-    conditional_pattern = r'builder\.add_conditional_edges\s*\(\s*["\'](\w+)["\'][^{]*\{([^}]+)\}'
-    conditional_matches = re.findall(conditional_pattern, code, re.DOTALL)
 
-    for source, targets_str in conditional_matches:
-        target_pattern = r'["\'](\w+)["\']\s*:\s*["\']?(\w+)["\']?'
-        targets = re.findall(target_pattern, targets_str)
+def _reachable_masks(successors: list[list[int]]) -> list[int]:
+    """Compute the nodes reachable from every node as bitmasks of node ids.
 
-        for _, target in targets:
-            if target:
-                normalized_target = "END" if target == "END" else target
-                graph[source].append(normalized_target)
+    Args:
+        successors: Successor ids for each node id
 
-    return graph
+    Returns:
+        List mapping each node id to a bitmask of the node ids reachable from it
+    """
+    reachable = [0] * len(successors)
 
+    # Propagate successor masks until nothing changes (cycles need extra rounds)
+    changed = True
+    while changed:
+        changed = False
+        for node in reversed(range(len(successors))):
+            mask = reachable[node]
+            for next_node in successors[node]:
+                mask |= 1 << next_node | reachable[next_node]
+            if mask != reachable[node]:
+                reachable[node] = mask
+                changed = True
 
-# STEP 2: FIND ALL PATHS USING DFS
-def find_all_paths(graph: dict, start: str = "START", end: str = "END") -> list[list[str]]:
-    """Find all possible paths from start to end using DFS.
+    return reachable
+
+
+def find_all_paths(graph: dict, start: str = "START", end: str = "END") -> list[tuple[str, ...]]:
+    """Find all possible paths from start to end using iterative DFS.
+
+    Nodes that cannot reach end are never entered. The search runs on integer
+    node ids with bitmask visited sets, names are decoded once at the end. Each
+    node is visited at most twice (once more for a self-loop), so paths are
+    bounded without a length cap.
 
     Args:
         graph: Adjacency list representation
@@ -86,41 +234,127 @@ def find_all_paths(graph: dict, start: str = "START", end: str = "END") -> list[
         end: Ending node
 
     Returns:
-        List of paths (each path is a list of node names)
+        List of paths (each path is a tuple of node names)
     """
+    if start == end:
+        return [(start,)]
+
+    names, ids, successors = _index_graph(graph, start, end)
+    start_id, end_id = ids[start], ids[end]
+
     all_paths = []
 
-    def dfs(current: str, path: list[str], visited: set[str]):
-        if len(path) > 20:  # Prevent infinite loops
-            return
+    reachable = _reachable_masks(successors)
+    can_reach_end = [node == end_id or reachable[node] >> end_id & 1 for node in range(len(names))]
 
-        if current == end:
+    # Iterative DFS: each frame holds the successor iterator of the node at the
+    # same depth in `path` and the visited mask on entering it
+    path = [start_id]
+    visit_counts = [0] * len(names)
+    visit_counts[start_id] = 1
+    stack = [(iter(successors[start_id]), 1 << start_id)]
+
+    while stack:
+        next_nodes, visited = stack[-1]
+        current = path[-1]
+        next_node = next(next_nodes, None)
+
+        if next_node is None:
+            stack.pop()
+            path.pop()
+            visit_counts[current] -= 1
+            continue
+
+        # Dead-end branches can never produce a path
+        if not can_reach_end[next_node]:
+            continue
+
+        # Allow self-loops once (for human feedback)
+        if visited >> next_node & 1 and not (next_node == current and visit_counts[current] < 2):
+            continue
+
+        path.append(next_node)
+
+        if next_node == end_id:
             all_paths.append(path.copy())
-            return
+            path.pop()
+            continue
 
-        next_nodes = graph.get(current, [])
+        visit_counts[next_node] += 1
+        stack.append((iter(successors[next_node]), visited | 1 << next_node))
+
+    return [tuple([names[i] for i in p]) for p in all_paths]
 
-        for next_node in next_nodes:
-            # Allow self-loops once (for human feedback)
-            if next_node not in visited or (next_node == current and path.count(current) < 2):
-                new_visited = visited.copy()
-                if next_node != current:
-                    new_visited.add(next_node)
 
-                path.append(next_node)
-                dfs(next_node, path, new_visited)
-                path.pop()
+def find_dag_paths(graph: dict, start: str = "START", end: str = "END") -> tuple[list[tuple[str, ...]], dict[str, int]] | None:
+    """Find all paths from start to end on a graph that is acyclic apart from self-loops.
 
-    dfs(start, [start], {start})
-    return all_paths
+    Self-loops are split off as metadata, the remaining edges are ordered with
+    Kahn's algorithm, and the paths to end are built once per node in reverse
+    topological order. All bookkeeping uses lists indexed by integer node id.
+
+    Args:
+        graph: Adjacency list representation
+        start: Starting node
+        end: Ending node
+
+    Returns:
+        Tuple of (paths without self-loops, number of self-loop edges per node
+        with a self-loop), or None if the graph has cycles other than self-loops
+    """
+    names, ids, successors = _index_graph(graph, start, end)
+    start_id, end_id = ids[start], ids[end]
+
+    # Several edges (e.g. conditional keys) may route a node back to itself
+    self_loops = {
+        names[node]: next_nodes.count(node)
+        for node, next_nodes in enumerate(successors)
+        if node in next_nodes
+    }
+    dag = [
+        [next_node for next_node in next_nodes if next_node != node] if node != end_id else []
+        for node, next_nodes in enumerate(successors)
+    ]
+
+    # Kahn's algorithm: repeatedly take nodes with no remaining incoming edges
+    in_degree = [0] * len(names)
+    for next_nodes in dag:
+        for next_node in next_nodes:
+            in_degree[next_node] += 1
+
+    order = []
+    ready = [node for node, degree in enumerate(in_degree) if degree == 0]
+    while ready:
+        node = ready.pop()
+        order.append(node)
+        for next_node in dag[node]:
+            in_degree[next_node] -= 1
+            if in_degree[next_node] == 0:
+                ready.append(next_node)
+
+    if len(order) < len(names):
+        return None
+
+    paths_to_end = [[] for _ in names]
+    paths_to_end[end_id] = [(end,)]
+    for node in reversed(order):
+        if node != end_id:
+            paths_to_end[node] = [
+                (names[node],) + path
+                for next_node in dag[node]
+                for path in paths_to_end[next_node]
+            ]
+
+    return paths_to_end[start_id], self_loops
 
 
 # STEP 3: NORMALIZE PATHS WITH KLEENE STAR
-def normalize_path_with_kleene(path: list[str]) -> str:
+def normalize_path_with_kleene(path: Sequence[str], self_loops: Collection[str] | None = None) -> str:
     """Convert a path with self-loops to Kleene star notation.
 
     Args:
-        path: List of node names
+        path: Sequence of node names
+        self_loops: Nodes to star even when they are not repeated in the path
 
     Returns:
         String representation using Kleene star for repeated nodes
@@ -129,65 +363,156 @@ def normalize_path_with_kleene(path: list[str]) -> str:
         ["START", "supervisor", "supervisor", "policy", "END"]
         -> "START -> supervisor* -> policy -> END"
     """
-    if not path:
-        return ""
-
     normalized = []
-    i = 0
-
-    while i < len(path):
-        current = path[i]
+    previous = None
 
-        # Check if next node is the same (self-loop)
-        if i + 1 < len(path) and path[i + 1] == current:
-            normalized.append(f"{current}*")
-            # Skip all consecutive occurrences
-            while i < len(path) and path[i] == current:
-                i += 1
+    # Consecutive occurrences of a node (self-loop) collapse into one starred node
+    for node in path:
+        if node == previous:
+            normalized[-1] = f"{node}*"
         else:
-            normalized.append(current)
-            i += 1
+            normalized.append(f"{node}*" if self_loops and node in self_loops else node)
+            previous = node
 
     return " -> ".join(normalized)
 
 
-def group_paths_by_base(paths: list[list[str]]) -> dict[str, list[list[str]]]:
-    """Group paths by their base structure (ignoring self-loops).
+def group_paths_by_base(paths: list[tuple[str, ...]]) -> dict[str, list]:
+    """Group paths by their base structure (ignoring self-loops) in a single pass.
 
     Args:
         paths: List of paths
 
     Returns:
-        Dictionary mapping base path to all variants
+        Dictionary mapping base path to (longest variant, number of variants)
     """
-    groups = defaultdict(list)
+    groups = {}
 
     for path in paths:
         # Create base path by removing consecutive duplicates
         base = []
-        for i, node in enumerate(path):
-            if i == 0 or node != path[i - 1]:
+        previous = None
+        for node in path:
+            if node != previous:
                 base.append(node)
-
+                previous = node
         base_key = " -> ".join(base)
-        groups[base_key].append(path)
+
+        # Groups are [longest variant, count] lists updated in place
+        group = groups.get(base_key)
+        if group is None:
+            groups[base_key] = [path, 1]
+        else:
+            if len(path) > len(group[0]):
+                group[0] = path
+            group[1] += 1
 
     return groups
 
 
 # STEP 4: LLM ANALYSIS FOR INPUT REQUIREMENTS AND EVALUATOR RECOMMENDATION
-async def analyze_workflow_input(normalized_path: str) -> tuple[str, str, str, str]:
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# Shared chat client, created on first use so its connection pool is reused
+_llm: UiPathAzureChatOpenAI | None = None
+
+
+def _get_llm() -> UiPathAzureChatOpenAI:
+    """Return the shared chat client, creating it on first use."""
+    global _llm
+    if _llm is None:
+        _llm = UiPathAzureChatOpenAI()
+    return _llm
+
+
+# Deterministic analyses for known routes, matched against the nodes of a
+# normalized path (first match wins). Paths that match no rule go to the LLM.
+_TRAJECTORY_RATIONALE = (
+    "The supervisor may loop for human-in-the-loop feedback before routing, so the "
+    "whole execution path through the graph should be judged rather than only the final output."
+)
+
+_RULES: list[tuple[frozenset[str], tuple[str, str, str, str]]] = [
+    (
+        frozenset({"supervisor*", "verify_credentials", "procurement"}),
+        (
+            json.dumps({"question": "<string>", "email": "<@uipath.com email>", "code": "<valid 4-digit code>"}),
+            json.dumps({
+                "question": "I met a new prospect at a conference, I need to add him to the CRM",
+                "category": "procurement",
+                "email": "jane.doe@uipath.com",
+                "code": "4827",
+            }),
+            "LLMJudgeTrajectoryEvaluator",
+            _TRAJECTORY_RATIONALE,
+        ),
+    ),
+    (
+        frozenset({"supervisor*", "verify_credentials"}),
+        (
+            json.dumps({"question": "<string>", "email": "<missing or invalid email>", "code": "<missing or invalid code>"}),
+            json.dumps({
+                "question": "I need to order a new laptop for a new hire",
+                "category": "procurement",
+                "email": "jane.doe@uipath.com",
+            }),
+            "LLMJudgeTrajectoryEvaluator",
+            _TRAJECTORY_RATIONALE,
+        ),
+    ),
+    (
+        frozenset({"supervisor*", "permission_check_local_DB", "hr"}),
+        (
+            json.dumps({"question": "<string>", "email": "<email in hr_auth.json>"}),
+            json.dumps({
+                "question": "How many days notice for 3 day PTO?",
+                "category": "hr",
+                "email": "me@example.com",
+            }),
+            "LLMJudgeTrajectoryEvaluator",
+            _TRAJECTORY_RATIONALE,
+        ),
+    ),
+    (
+        frozenset({"supervisor*", "policy"}),
+        (
+            json.dumps({"question": "<string>"}),
+            json.dumps({"question": "What is the dress code for client meetings?", "category": "policy"}),
+            "LLMJudgeTrajectoryEvaluator",
+            _TRAJECTORY_RATIONALE,
+        ),
+    ),
+]
+
+
+def _apply_rules(normalized_path: str) -> tuple[str, str, str, str] | None:
+    """Look up a deterministic analysis for a workflow path.
+
+    Args:
+        normalized_path: The workflow path with Kleene star notation
+
+    Returns:
+        Tuple of (required_input_json, example_query, recommended_evaluator, evaluator_rationale),
+        or None if no rule matches
+    """
+    nodes = set(normalized_path.split(" -> "))
+    for required_nodes, analysis in _RULES:
+        if required_nodes <= nodes:
+            return analysis
+    return None
+
+
+async def analyze_workflow_input(normalized_path: str, llm: UiPathAzureChatOpenAI | None = None) -> tuple[str, str, str, str]:
     """Use LLM to determine what input triggers this workflow path and recommend evaluator.
 
     Args:
         normalized_path: The workflow path with Kleene star notation
+        llm: Chat model used for the analysis (defaults to the shared client)
 
     Returns:
         Tuple of (required_input_json, example_query, recommended_evaluator, evaluator_rationale)
     """
-    from uipath_langchain.chat.models import UiPathAzureChatOpenAI
-
-    llm = UiPathAzureChatOpenAI()
+    llm = llm or _get_llm()
 
     prompt = f"""Analyze this workflow execution path and provide comprehensive testing recommendations:
 
@@ -219,60 +544,21 @@ Based on the workflow path, determine:
 3. Which evaluator(s) would be BEST for testing this workflow
 4. Why that evaluator is the best choice
 
-Respond in this exact format:
-REQUIRED_INPUT: {{JSON object showing which fields are needed}}
-EXAMPLE_INPUT: {{Complete JSON example that would trigger this workflow}}
-RECOMMENDED_EVALUATOR: <evaluator name>
-EVALUATOR_RATIONALE: <1-2 sentences explaining why>
-
 Note: supervisor* means the supervisor node may loop for human-in-the-loop feedback when confidence < 50%.
 """
 
     try:
-        response = await llm.ainvoke(prompt)
-        response_text = response.content if hasattr(response, 'content') else str(response)
-
-        # Parse the response
-        required_input = ""
-        example_input = ""
-        recommended_evaluator = ""
-        evaluator_rationale = ""
-
-        lines = response_text.split('\n')
-        for i, line in enumerate(lines):
-            if 'REQUIRED_INPUT:' in line:
-                start_idx = i
-                required_parts = []
-                for j in range(start_idx, len(lines)):
-                    if any(keyword in lines[j] for keyword in ['EXAMPLE_INPUT:', 'RECOMMENDED_EVALUATOR:', 'EVALUATOR_RATIONALE:']):
-                        break
-                    required_parts.append(lines[j].replace('REQUIRED_INPUT:', '').strip())
-                required_input = ' '.join(required_parts).strip()
-
-            if 'EXAMPLE_INPUT:' in line:
-                start_idx = i
-                example_parts = []
-                for j in range(start_idx, len(lines)):
-                    if any(keyword in lines[j] for keyword in ['RECOMMENDED_EVALUATOR:', 'EVALUATOR_RATIONALE:']):
-                        break
-                    example_parts.append(lines[j].replace('EXAMPLE_INPUT:', '').strip())
-                example_input = ' '.join(example_parts).strip()
-
-            if 'RECOMMENDED_EVALUATOR:' in line:
-                recommended_evaluator = line.replace('RECOMMENDED_EVALUATOR:', '').strip()
-
-            if 'EVALUATOR_RATIONALE:' in line:
-                start_idx = i
-                rationale_parts = []
-                for j in range(start_idx, len(lines)):
-                    rationale_parts.append(lines[j].replace('EVALUATOR_RATIONALE:', '').strip())
-                evaluator_rationale = ' '.join(rationale_parts).strip()
+        structured_llm = llm.with_structured_output(WorkflowAnalysis)
+        result = await structured_llm.ainvoke(prompt)
+
+        required_input = result.required_input.model_dump(exclude_none=True)
+        example_input = result.example_input.model_dump(exclude_none=True)
 
         return (
-            required_input or "Analysis incomplete",
-            example_input or "{}",
-            recommended_evaluator or "LLMJudgeTrajectoryEvaluator",
-            evaluator_rationale or "Default trajectory evaluator"
+            json.dumps(required_input) if required_input else "Analysis incomplete",
+            json.dumps(example_input) if example_input else "{}",
+            result.recommended_evaluator or "LLMJudgeTrajectoryEvaluator",
+            result.evaluator_rationale or "Default trajectory evaluator"
         )
 
     except Exception as e:
@@ -293,12 +579,32 @@ async def analyze_workflows_with_llm_async(workflows: list[WorkflowPath]) -> lis
     """
     print("Analyzing workflows with LLM to determine input requirements and evaluators...")
 
-    # Analyze each workflow
-    updated_workflows = []
-    for i, wf in enumerate(workflows, 1):
-        print(f"  Analyzing workflow {i}/{len(workflows)}: {wf.normalized_path}")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
 
-        required_input, example_query, recommended_evaluator, evaluator_rationale = await analyze_workflow_input(wf.normalized_path)
+    # Identical paths get the same analysis, so only ask once per path
+    unique_paths = list(dict.fromkeys(wf.normalized_path for wf in workflows))
+
+    # Known routes are classified by rules, only the rest needs the LLM
+    results = {}
+    for path in unique_paths:
+        analysis = _apply_rules(path)
+        if analysis is not None:
+            results[path] = analysis
+    needs_llm = [path for path in unique_paths if path not in results]
+    print(f"  {len(results)} workflow(s) classified by rules, {len(needs_llm)} sent to LLM")
+
+    async def analyze(i: int, normalized_path: str) -> tuple[str, str, str, str]:
+        async with semaphore:
+            print(f"  Analyzing workflow {i}/{len(needs_llm)}: {normalized_path}")
+            return await analyze_workflow_input(normalized_path)
+
+    # Analyze remaining workflows concurrently, bounded for rate limits
+    analyses = await asyncio.gather(*(analyze(i, path) for i, path in enumerate(needs_llm, 1)))
+    results.update(zip(needs_llm, analyses))
+
+    updated_workflows = []
+    for wf in workflows:
+        required_input, example_query, recommended_evaluator, evaluator_rationale = results[wf.normalized_path]
 
         # Create updated workflow with input analysis and evaluator recommendation
         updated_wf = WorkflowPath(
@@ -328,60 +634,167 @@ def analyze_workflows_with_llm(workflows: list[WorkflowPath]) -> list[WorkflowPa
 
 
 # STEP 5: EXTRACT AND NORMALIZE WORKFLOWS
-def extract_and_normalize_workflows(file_path: str) -> list[WorkflowPath]:
+WORKFLOWS_CACHE_FILE = ".workflows_cache.json"
+
+# Keys the cache on this module's own source too, so any change to extraction
+# or normalization invalidates stale caches without a manual version bump
+with _map_source(__file__) as _module_source:
+    _CACHE_SALT = hashlib.blake2b(_module_source).digest()
+
+
+def _workflows_cache_key(file_path: str) -> str:
+    """Hash the source file contents, keyed by this module's source, for the workflows cache.
+
+    Args:
+        file_path: Path to main.py
+
+    Returns:
+        Hex digest identifying this version of the source
+    """
+    with _map_source(file_path) as code:
+        return hashlib.blake2b(code, key=_CACHE_SALT).hexdigest()
+
+
+def _load_cached_workflows(cache_path: str, key: str) -> list[WorkflowPath] | None:
+    """Load workflows from the cache file if it matches the given key.
+
+    Args:
+        cache_path: Path to the cache file
+        key: Cache key of the current source
+
+    Returns:
+        Cached WorkflowPath objects, or None on a miss
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("key") != key:
+            return None
+        return [WorkflowPath.model_validate(wf) for wf in cache["workflows"]]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_cached_workflows(cache_path: str, key: str, workflows: list[WorkflowPath]) -> None:
+    """Store workflows in the cache file under the given key.
+
+    Args:
+        cache_path: Path to the cache file
+        key: Cache key of the current source
+        workflows: List of WorkflowPath objects
+    """
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "workflows": [wf.model_dump() for wf in workflows]}, f)
+    except OSError as e:
+        print(f"WARNING: Could not write workflows cache '{cache_path}': {e}")
+
+
+def extract_and_normalize_workflows(file_path: str, cache_path: str | None = None) -> list[WorkflowPath]:
     """Complete pipeline: extract, normalize workflows.
 
     Args:
         file_path: Path to main.py
+        cache_path: Optional cache file; results are reused while main.py is unchanged
 
     Returns:
         List of WorkflowPath objects with normalized paths
     """
+    cache_key = None
+    if cache_path:
+        cache_key = _workflows_cache_key(file_path)
+        cached = _load_cached_workflows(cache_path, cache_key)
+        if cached is not None:
+            return cached
+
     # Step 1: Extract graph structure
     graph = extract_graph_from_code(file_path)
 
-    # Step 2: Find all paths
+    workflows = _normalize_workflows(graph)
+
+    if cache_key:
+        _save_cached_workflows(cache_path, cache_key, workflows)
+
+    return workflows
+
+
+def _normalize_workflows(graph: dict) -> list[WorkflowPath]:
+    """Find and normalize all workflow paths of an extracted graph.
+
+    Args:
+        graph: Adjacency list representation
+
+    Returns:
+        List of WorkflowPath objects with normalized paths
+    """
+    workflows = []
+
+    # Step 2: Find all paths, on the DAG without self-loops when possible
+    dag_paths = find_dag_paths(graph)
+    if dag_paths is not None:
+        paths, self_loops = dag_paths
+
+        # Step 3: Normalize, each self-loop node is visited once or re-entered
+        # through any one of its self-loop edges
+        variant_counts = {}
+        for path in paths:
+            normalized = normalize_path_with_kleene(path, self_loops)
+            variants = prod(1 + self_loops[node] for node in path if node in self_loops)
+            variant_counts[normalized] = variant_counts.get(normalized, 0) + variants
+
+        # Step 4: Create workflow path objects
+        for normalized, variant_count in variant_counts.items():
+            workflows.append(WorkflowPath(
+                normalized_path=normalized,
+                variant_count=variant_count
+            ))
+        return workflows
+
+    # Fall back to DFS for graphs with longer cycles
     paths = find_all_paths(graph)
 
     # Step 3: Group and normalize
     groups = group_paths_by_base(paths)
 
     # Step 4: Create workflow path objects
-    workflows = []
-    for base_path, variants in groups.items():
+    for base_path, (longest, variant_count) in groups.items():
         # Use the longest variant to get the normalized path with *
-        normalized = normalize_path_with_kleene(max(variants, key=len))
+        normalized = normalize_path_with_kleene(longest)
 
         workflow = WorkflowPath(
             normalized_path=normalized,
-            variant_count=len(variants)
+            variant_count=variant_count
         )
         workflows.append(workflow)
 
     return workflows
 
 
+JSON_WRITE_BUFFER_SIZE = 64 * 1024
+
+
 def save_workflows_to_json(workflows: list[WorkflowPath], output_path: str) -> None:
-    """Save workflows to JSON file.
+    """Save workflows to JSON file (with orjson when available).
 
     Args:
         workflows: List of WorkflowPath objects
         output_path: Path to output JSON file
     """
-    import json
-
     data = [wf.model_dump() for wf in workflows]
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb', buffering=JSON_WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8', buffering=JSON_WRITE_BUFFER_SIZE) as f:
+            json.dump(data, f, indent=2)
 
     print(f"Saved {len(workflows)} workflow paths to {output_path}")
 
 if __name__ == "__main__":
-    import sys
-
     # Automatic extraction from main.py
-    main_path = os.path.join(os.path.dirname(__file__), "main.py")
+    output_dir = os.path.dirname(__file__)
+    main_path = os.path.join(output_dir, "main.py")
 
     print("=" * 80)
     print("WORKFLOW EXTRACTION")
@@ -389,7 +802,9 @@ if __name__ == "__main__":
     print(f"\nExtracting from: {main_path}\n")
 
     # Extract and normalize workflows
-    workflows = extract_and_normalize_workflows(main_path)
+    workflows = extract_and_normalize_workflows(
+        main_path, cache_path=os.path.join(output_dir, WORKFLOWS_CACHE_FILE)
+    )
     print(f"Found {len(workflows)} workflow paths\n")
 
     # Save to files
@@ -401,8 +816,6 @@ if __name__ == "__main__":
         # Analyze workflows with LLM to determine input requirements
         workflows = analyze_workflows_with_llm(workflows)
 
-        output_dir = os.path.dirname(__file__)
-
         # Save to JSON
         json_path = os.path.join(output_dir, "workflows.json")
         save_workflows_to_json(workflows, json_path)
\ No newline at end of file